@@ -0,0 +1,45 @@
+"""
+Initial activities data used to seed and restore state in the API tests
+"""
+
+# (name, description, schedule, max_participants, participants)
+_ROWS = (
+    ("Soccer Team", "Join the school soccer team and compete in local leagues",
+     "Wednesdays and Fridays, 4:00 PM - 5:30 PM", 18,
+     ("lucas@mergington.edu", "mia@mergington.edu")),
+    ("Basketball Club", "Practice basketball skills and play friendly matches",
+     "Tuesdays, 4:00 PM - 5:30 PM", 15,
+     ("liam@mergington.edu",)),
+    ("Art Club", "Explore painting, drawing, and other visual arts",
+     "Thursdays, 3:30 PM - 5:00 PM", 16,
+     ("ava@mergington.edu",)),
+    ("Drama Society", "Participate in theater productions and acting workshops",
+     "Mondays, 4:00 PM - 5:30 PM", 20,
+     ("noah@mergington.edu",)),
+    ("Math Olympiad", "Prepare for math competitions and solve challenging problems",
+     "Fridays, 2:00 PM - 3:30 PM", 10,
+     ("isabella@mergington.edu",)),
+    ("Science Club", "Conduct experiments and explore scientific concepts",
+     "Wednesdays, 3:30 PM - 5:00 PM", 14,
+     ("ethan@mergington.edu",)),
+    ("Chess Club", "Learn strategies and compete in chess tournaments",
+     "Fridays, 3:30 PM - 5:00 PM", 12,
+     ("michael@mergington.edu", "daniel@mergington.edu")),
+    ("Programming Class", "Learn programming fundamentals and build software projects",
+     "Tuesdays and Thursdays, 3:30 PM - 4:30 PM", 20,
+     ("emma@mergington.edu", "sophia@mergington.edu")),
+    ("Gym Class", "Physical education and sports activities",
+     "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM", 30,
+     ("john@mergington.edu", "olivia@mergington.edu")),
+)
+
+# Original activities, expanded once at import and cloned for each test
+ORIGINAL_ACTIVITIES = {
+    name: {
+        "description": description,
+        "schedule": schedule,
+        "max_participants": max_participants,
+        "participants": list(participants)
+    }
+    for name, description, schedule, max_participants, participants in _ROWS
+}
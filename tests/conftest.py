@@ -3,86 +3,67 @@ Test configuration and fixtures for the Mergington High School API tests
 """
 
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from fastapi import status
 from src.app import app, activities
+from tests._fixture_data import ORIGINAL_ACTIVITIES
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application"""
-    return TestClient(app)
+    """Create a single test client for the FastAPI application, shared across the session"""
+    # Imported here so collection does not pay for loading the test client stack
+    from fastapi.testclient import TestClient
+    
+    with TestClient(app) as c:
+        yield c
 
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities data to initial state before each test"""
-    # Store original activities
-    original_activities = {
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in local leagues",
-            "schedule": "Wednesdays and Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play friendly matches",
-            "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["liam@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore painting, drawing, and other visual arts",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["ava@mergington.edu"]
-        },
-        "Drama Society": {
-            "description": "Participate in theater productions and acting workshops",
-            "schedule": "Mondays, 4:00 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["noah@mergington.edu"]
-        },
-        "Math Olympiad": {
-            "description": "Prepare for math competitions and solve challenging problems",
-            "schedule": "Fridays, 2:00 PM - 3:30 PM",
-            "max_participants": 10,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["ethan@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
+@pytest_asyncio.fixture
+async def async_client():
+    """Create an async client that calls the FastAPI application in-process"""
+    from httpx import ASGITransport, AsyncClient
     
-    # Reset activities to original state
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+def _clone_activities(source=ORIGINAL_ACTIVITIES):
+    """Copy activities data, duplicating only the mutable participant lists"""
+    return {name: {**details, "participants": list(details["participants"])}
+            for name, details in source.items()}
+
+
+def _restore_activities(snapshot):
+    """Restore activities data in place from a snapshot"""
     activities.clear()
-    activities.update(original_activities)
-    
+    activities.update(_clone_activities(snapshot))
+
+
+@pytest.fixture(scope="session")
+def initial_state():
+    """Seed activities once per session with the initial data that every restore returns to"""
+    _restore_activities(ORIGINAL_ACTIVITIES)
+    return ORIGINAL_ACTIVITIES
+
+
+@pytest.fixture
+def reset_activities(initial_state):
+    """Restore activities data to the initial state after each mutating test"""
+    # Every test restores on teardown, so the next one already starts clean.
+    # Each pytest-xdist worker is its own interpreter, so this in-place
+    # restore only ever touches that worker's copy of activities.
     yield
     
-    # Reset activities again after test
-    activities.clear()
-    activities.update(original_activities)
+    _restore_activities(initial_state)
+
+
+@pytest.fixture(scope="module")
+def activities_payload(client, initial_state):
+    """Fetch and decode GET /activities once per module for read-only tests"""
+    response = client.get("/activities")
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
 
 
 @pytest.fixture
@@ -2,8 +2,46 @@
 Tests for the Mergington High School Activities API endpoints
 """
 
+import asyncio
+from urllib.parse import quote
+
 import pytest
 from fastapi import status
+from src.app import activities
+
+_SOCCER_TEAM = "Soccer Team"
+_ART_CLUB = "Art Club"
+_DRAMA_SOCIETY = "Drama Society"
+_MATH_OLYMPIAD = "Math Olympiad"
+_SCIENCE_CLUB = "Science Club"
+_CHESS_CLUB = "Chess Club"
+_PROGRAMMING_CLASS = "Programming Class"
+_NONEXISTENT_ACTIVITY = "Nonexistent Activity"
+_ACTIVITY_NOT_FOUND = "Activity not found"
+
+_LUCAS = "lucas@mergington.edu"
+_MIA = "mia@mergington.edu"
+_UNKNOWN_STUDENT = "student@mergington.edu"
+
+_EXPECTED_ACTIVITIES = frozenset({
+    _SOCCER_TEAM, "Basketball Club", _ART_CLUB, _DRAMA_SOCIETY,
+    _MATH_OLYMPIAD, _SCIENCE_CLUB, _CHESS_CLUB, _PROGRAMMING_CLASS, "Gym Class"
+})
+
+
+def _signup(client, activity, email):
+    """Sign up a student for an activity, letting httpx encode the email query"""
+    return client.post("/activities/" + quote(activity) + "/signup", params={"email": email})
+
+
+def _unregister(client, activity, email):
+    """Unregister a student from an activity, letting httpx encode the email query"""
+    return client.delete("/activities/" + quote(activity) + "/unregister", params={"email": email})
+
+
+def _assert_participant(activity, email, present=True):
+    """Assert whether a student is currently signed up, checking the activities dict directly"""
+    assert (email in activities[activity]["participants"]) == present
 
 
 class TestRootEndpoint:
@@ -19,29 +57,18 @@ class TestRootEndpoint:
 class TestActivitiesEndpoint:
     """Tests for the activities endpoint"""
     
-    def test_get_activities_success(self, client, reset_activities):
+    def test_get_activities_success(self, activities_payload):
         """Test successful retrieval of activities"""
-        response = client.get("/activities")
-        assert response.status_code == status.HTTP_200_OK
-        
-        activities = response.json()
-        assert isinstance(activities, dict)
-        assert len(activities) > 0
+        assert isinstance(activities_payload, dict)
+        assert len(activities_payload) > 0
         
         # Check that all expected activities are present
-        expected_activities = [
-            "Soccer Team", "Basketball Club", "Art Club", "Drama Society",
-            "Math Olympiad", "Science Club", "Chess Club", "Programming Class", "Gym Class"
-        ]
-        for activity_name in expected_activities:
-            assert activity_name in activities
+        missing = _EXPECTED_ACTIVITIES - activities_payload.keys()
+        assert not missing, f"Missing activities: {sorted(missing)}"
     
-    def test_activities_structure(self, client, reset_activities):
+    def test_activities_structure(self, activities_payload):
         """Test that activities have the correct structure"""
-        response = client.get("/activities")
-        activities = response.json()
-        
-        for activity_name, activity_data in activities.items():
+        for activity_name, activity_data in activities_payload.items():
             assert "description" in activity_data
             assert "schedule" in activity_data
             assert "max_participants" in activity_data
@@ -52,27 +79,29 @@ class TestActivitiesEndpoint:
             assert isinstance(activity_data["max_participants"], int)
             assert isinstance(activity_data["participants"], list)
     
-    def test_soccer_team_specific_data(self, client, reset_activities):
+    def test_soccer_team_specific_data(self, activities_payload):
         """Test specific data for Soccer Team activity"""
-        response = client.get("/activities")
-        activities = response.json()
-        
-        soccer_team = activities["Soccer Team"]
+        soccer_team = activities_payload[_SOCCER_TEAM]
         assert soccer_team["max_participants"] == 18
-        assert "lucas@mergington.edu" in soccer_team["participants"]
-        assert "mia@mergington.edu" in soccer_team["participants"]
+        assert _LUCAS in soccer_team["participants"]
+        assert _MIA in soccer_team["participants"]
         assert len(soccer_team["participants"]) == 2
 
 
 class TestSignupEndpoint:
     """Tests for the activity signup endpoint"""
     
-    def test_successful_signup(self, client, reset_activities):
-        """Test successful signup for an activity"""
-        email = "newstudent@mergington.edu"
-        activity = "Soccer Team"
-        
-        response = client.post(f"/activities/{activity}/signup?email={email}")
+    @pytest.mark.parametrize("activity, email", [
+        (_SOCCER_TEAM, "newstudent@mergington.edu"),
+        (_ART_CLUB, "student-test@mergington.edu"),
+        # Sent as Programming%20Class and test%40mergington.edu
+        (_PROGRAMMING_CLASS, "test@mergington.edu"),
+        # The plus sign is sent URL encoded as %2B
+        (_SCIENCE_CLUB, "student+test@mergington.edu"),
+    ], ids=["plain", "hyphen-in-email", "url-encoding", "plus-sign-in-email"])
+    def test_successful_signup(self, client, reset_activities, activity, email):
+        """Test successful signup for an activity across email and name encodings"""
+        response = _signup(client, activity, email)
         assert response.status_code == status.HTTP_200_OK
         
         result = response.json()
@@ -80,80 +109,32 @@ class TestSignupEndpoint:
         assert email in result["message"]
         assert activity in result["message"]
         
-        # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email in activities[activity]["participants"]
+        # Verify the participant was added with the decoded email
+        _assert_participant(activity, email)
     
     def test_signup_nonexistent_activity(self, client, reset_activities):
         """Test signup for a non-existent activity"""
-        email = "student@mergington.edu"
-        activity = "Nonexistent Activity"
+        email = _UNKNOWN_STUDENT
+        activity = _NONEXISTENT_ACTIVITY
         
-        response = client.post(f"/activities/{activity}/signup?email={email}")
+        response = _signup(client, activity, email)
         assert response.status_code == status.HTTP_404_NOT_FOUND
         
         result = response.json()
         assert "detail" in result
-        assert "Activity not found" in result["detail"]
+        assert _ACTIVITY_NOT_FOUND in result["detail"]
     
     def test_duplicate_signup(self, client, reset_activities):
         """Test duplicate signup for the same activity"""
-        email = "lucas@mergington.edu"  # Already signed up for Soccer Team
-        activity = "Soccer Team"
+        email = _LUCAS  # Already signed up for Soccer Team
+        activity = _SOCCER_TEAM
         
-        response = client.post(f"/activities/{activity}/signup?email={email}")
+        response = _signup(client, activity, email)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         
         result = response.json()
         assert "detail" in result
         assert "already signed up" in result["detail"]
-    
-    def test_signup_with_special_characters_in_email(self, client, reset_activities):
-        """Test signup with special characters in email"""
-        email = "student-test@mergington.edu"  # Use hyphen instead of plus
-        activity = "Art Club"
-        
-        response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert response.status_code == status.HTTP_200_OK
-        
-        # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email in activities[activity]["participants"]
-    
-    def test_signup_url_encoding(self, client, reset_activities):
-        """Test signup with URL-encoded parameters"""
-        email = "test@mergington.edu"
-        activity = "Programming Class"
-        
-        # Use URL encoding
-        encoded_email = "test%40mergington.edu"
-        encoded_activity = "Programming%20Class"
-        
-        response = client.post(f"/activities/{encoded_activity}/signup?email={encoded_email}")
-        assert response.status_code == status.HTTP_200_OK
-        
-        # Verify the participant was added with the decoded email
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email in activities[activity]["participants"]
-    
-    def test_signup_with_plus_sign_in_email(self, client, reset_activities):
-        """Test signup with plus sign in email (URL encoded properly)"""
-        original_email = "student+test@mergington.edu"
-        activity = "Science Club"
-        
-        # Properly URL encode the plus sign as %2B
-        encoded_email = "student%2Btest@mergington.edu"
-        
-        response = client.post(f"/activities/{activity}/signup?email={encoded_email}")
-        assert response.status_code == status.HTTP_200_OK
-        
-        # Verify the participant was added with the original email
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert original_email in activities[activity]["participants"]
 
 
 class TestUnregisterEndpoint:
@@ -161,10 +142,10 @@ class TestUnregisterEndpoint:
     
     def test_successful_unregister(self, client, reset_activities):
         """Test successful unregistration from an activity"""
-        email = "lucas@mergington.edu"  # Already signed up for Soccer Team
-        activity = "Soccer Team"
+        email = _LUCAS  # Already signed up for Soccer Team
+        activity = _SOCCER_TEAM
         
-        response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        response = _unregister(client, activity, email)
         assert response.status_code == status.HTTP_200_OK
         
         result = response.json()
@@ -173,28 +154,26 @@ class TestUnregisterEndpoint:
         assert activity in result["message"]
         
         # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email not in activities[activity]["participants"]
+        _assert_participant(activity, email, present=False)
     
     def test_unregister_nonexistent_activity(self, client, reset_activities):
         """Test unregistration from a non-existent activity"""
-        email = "student@mergington.edu"
-        activity = "Nonexistent Activity"
+        email = _UNKNOWN_STUDENT
+        activity = _NONEXISTENT_ACTIVITY
         
-        response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        response = _unregister(client, activity, email)
         assert response.status_code == status.HTTP_404_NOT_FOUND
         
         result = response.json()
         assert "detail" in result
-        assert "Activity not found" in result["detail"]
+        assert _ACTIVITY_NOT_FOUND in result["detail"]
     
     def test_unregister_not_signed_up(self, client, reset_activities):
         """Test unregistration when not signed up for the activity"""
         email = "notsignedup@mergington.edu"
-        activity = "Soccer Team"
+        activity = _SOCCER_TEAM
         
-        response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        response = _unregister(client, activity, email)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         
         result = response.json()
@@ -204,19 +183,14 @@ class TestUnregisterEndpoint:
     def test_unregister_url_encoding(self, client, reset_activities):
         """Test unregistration with URL-encoded parameters"""
         email = "michael@mergington.edu"  # Already signed up for Chess Club
-        activity = "Chess Club"
+        activity = _CHESS_CLUB
         
-        # Use URL encoding
-        encoded_email = "michael%40mergington.edu"
-        encoded_activity = "Chess%20Club"
-        
-        response = client.delete(f"/activities/{encoded_activity}/unregister?email={encoded_email}")
+        # The helper sends this as Chess%20Club and michael%40mergington.edu
+        response = _unregister(client, activity, email)
         assert response.status_code == status.HTTP_200_OK
         
         # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email not in activities[activity]["participants"]
+        _assert_participant(activity, email, present=False)
 
 
 class TestIntegrationScenarios:
@@ -225,68 +199,60 @@ class TestIntegrationScenarios:
     def test_signup_and_unregister_flow(self, client, reset_activities):
         """Test complete signup and unregister flow"""
         email = "flowtest@mergington.edu"
-        activity = "Drama Society"
+        activity = _DRAMA_SOCIETY
         
         # Initial state - user not signed up
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email not in activities[activity]["participants"]
+        _assert_participant(activity, email, present=False)
         initial_count = len(activities[activity]["participants"])
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+        signup_response = _signup(client, activity, email)
         assert signup_response.status_code == status.HTTP_200_OK
         
         # Verify signup
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email in activities[activity]["participants"]
+        _assert_participant(activity, email)
         assert len(activities[activity]["participants"]) == initial_count + 1
         
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        unregister_response = _unregister(client, activity, email)
         assert unregister_response.status_code == status.HTTP_200_OK
         
         # Verify unregistration
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email not in activities[activity]["participants"]
+        _assert_participant(activity, email, present=False)
         assert len(activities[activity]["participants"]) == initial_count
     
-    def test_multiple_activities_signup(self, client, reset_activities):
+    @pytest.mark.asyncio
+    async def test_multiple_activities_signup(self, async_client, reset_activities):
         """Test signing up for multiple activities"""
         email = "multisignup@mergington.edu"
-        activities_to_join = ["Art Club", "Science Club", "Chess Club"]
-        
-        for activity in activities_to_join:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
+        activities_to_join = [_ART_CLUB, _SCIENCE_CLUB, _CHESS_CLUB]
+        
+        # Signups to different activities are independent, so issue them concurrently
+        responses = await asyncio.gather(*(
+            _signup(async_client, activity, email)
+            for activity in activities_to_join
+        ))
+        for response in responses:
             assert response.status_code == status.HTTP_200_OK
         
         # Verify user is signed up for all activities
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        
         for activity in activities_to_join:
-            assert email in activities[activity]["participants"]
+            _assert_participant(activity, email)
     
     def test_activity_capacity_tracking(self, client, reset_activities):
         """Test that participant counts are correctly tracked"""
-        activity = "Math Olympiad"
+        activity = _MATH_OLYMPIAD
         
         # Get initial state
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         initial_participants = len(activities[activity]["participants"])
         max_participants = activities[activity]["max_participants"]
         
         # Add a new participant
         new_email = "capacity@mergington.edu"
-        signup_response = client.post(f"/activities/{activity}/signup?email={new_email}")
+        signup_response = _signup(client, activity, new_email)
         assert signup_response.status_code == status.HTTP_200_OK
         
         # Verify participant count increased
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         new_participants = len(activities[activity]["participants"])
         assert new_participants == initial_participants + 1
         assert new_participants <= max_participants